@@ -2,17 +2,133 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
 import logging
 import secrets
-from datetime import datetime, timedelta
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
+import ijson
+from aiohttp_retry import ExponentialRetry, RetryClient
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - platforms without orjson wheels
+    _json_loads = json.loads
 
 from .const import API_VERSION, APP_VERSION, USER_AGENT
+from .reliability import CircuitBreaker, CircuitBreakerOpenError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Safety margin subtracted from the token lifetime so we re-authenticate
+# slightly before the server-side expiry.
+TOKEN_EXPIRY_MARGIN = timedelta(seconds=30)
+
+# Fallback token lifetime when the response carries no expiry information.
+DEFAULT_TOKEN_TTL = timedelta(minutes=30)
+
+# Bound every request explicitly instead of inheriting aiohttp's
+# 5-minute default total timeout.
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10, sock_read=15)
+
+# Retry transient upstream failures with exponential backoff and full jitter.
+# Auth failures (401/403) are deliberately not retried here; get_schedules
+# handles those by re-authenticating once.
+_RETRY_OPTIONS = ExponentialRetry(
+    attempts=4,
+    start_timeout=0.5,
+    max_timeout=8.0,
+    factor=2.0,
+    statuses={429, 502, 503, 504},
+    exceptions={aiohttp.ClientConnectionError, asyncio.TimeoutError},
+    random_interval_size=0.5,
+)
+
+
+# Headers that never change per request, built once at import time.
+# _get_headers only materializes a new dict when a token must be added.
+_STATIC_HEADERS: Mapping[str, str] = MappingProxyType(
+    {
+        "User-Agent": USER_AGENT,
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Origin": "file://",
+        "X-Requested-With": "com.transfinder.stopfinder",
+        "X-StopfinderApp-Version": APP_VERSION,
+    }
+)
+
+# Discovered API base URLs keyed by configured base URL. The discovery
+# result essentially never changes, so it is memoized at module scope to
+# survive config entry reloads; entries expire after 24 hours.
+_BASE_URL_CACHE: dict[str, tuple[str, float]] = {}
+_BASE_URL_CACHE_TTL = 86400
+
+
+def _decode_jwt_expiry(token: str) -> datetime | None:
+    """Extract the `exp` claim from a JWT token, if it is one."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        payload = parts[1]
+        # JWT payloads are base64url without padding
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        exp = claims.get("exp")
+        if exp is None:
+            return None
+        return datetime.utcfromtimestamp(float(exp))
+    except (ValueError, TypeError):
+        return None
+
+
+@dataclass(slots=True)
+class Trip:
+    """A single bus trip for a student."""
+
+    name: str = ""
+    bus_number: str = ""
+    pickup_time: str | None = None
+    pickup_stop_name: str = ""
+    dropoff_time: str | None = None
+    dropoff_stop_name: str = ""
+    to_school: bool = False
+    vehicle_id: str = ""
+    start_time: str | None = None
+    finish_time: str | None = None
+    # Parsed forms of the time fields, annotated by the coordinator after
+    # fetch so sensors read ready-made datetimes. Derived data, so kept
+    # out of equality comparisons.
+    pickup_dt: datetime | None = field(default=None, compare=False)
+    dropoff_dt: datetime | None = field(default=None, compare=False)
+    start_dt: datetime | None = field(default=None, compare=False)
+
+
+@dataclass(slots=True)
+class Student:
+    """A student and the trips scheduled for them."""
+
+    rider_id: str = ""
+    first_name: str = ""
+    last_name: str = ""
+    grade: str = ""
+    school: str = ""
+    trips: list[Trip] = field(default_factory=list)
+    # Filled in by the coordinator; excluded from equality so a fresh
+    # fetch still compares equal to already-enriched stored data
+    display_name: str = field(default="", compare=False)
+    device_key: str = field(default="", compare=False)
+
 
 class StopfinderApiError(Exception):
     """Base exception for Stopfinder API errors."""
@@ -34,52 +150,134 @@ class StopfinderApiClient:
         base_url: str,
         username: str,
         password: str,
-        session: aiohttp.ClientSession,
+        session: aiohttp.ClientSession | None = None,
+        client_id: str | None = None,
     ) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        A client_id persisted from an earlier session skips the
+        /systems/apiversions request entirely on the first authentication.
+
+        When no session is given, the client owns a dedicated session whose
+        connector keeps connections warm between polls (HA's shared session
+        drops idle connections well before the poll interval); close() must
+        then be called on teardown.
+        """
         self._base_url = base_url.rstrip("/")
         self._username = username
         self._password = password
-        self._session = session
+        if session is None:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=10,
+                    keepalive_timeout=120,
+                    enable_cleanup_closed=True,
+                    ttl_dns_cache=300,
+                )
+            )
+            self._owns_session = True
+        else:
+            self._owns_session = False
+        self._client_session = session
+        self._session = RetryClient(
+            client_session=session, retry_options=_RETRY_OPTIONS
+        )
         self._token: str | None = None
-        self._client_id: str | None = None
+        self._token_expires_at: datetime | None = None
+        self._client_id = client_id
         self._api_base_url: str | None = None
+        self._breaker = CircuitBreaker(threshold=5, recovery=60.0)
+        # Conditional-request state for /students; populated only when the
+        # server emits validator headers on a 200 response.
+        self._last_etag: str | None = None
+        self._last_modified: str | None = None
+        self._cached_schedules: list[Student] | None = None
+        # Default-range request URL, rebuilt only when the date changes.
+        self._cached_url: tuple[str, str] | None = None
+        # Full authenticated header set, rebuilt only on (re-)auth.
+        self._auth_headers: dict[str, str] | None = None
+
+    @property
+    def client_id(self) -> str | None:
+        """Return the client ID, once known."""
+        return self._client_id
+
+    async def close(self) -> None:
+        """Close the session if this client owns it."""
+        if self._owns_session:
+            await self._client_session.close()
+
+    async def _guarded(self, func: Any, *args: Any) -> Any:
+        """Run a request coroutine through the circuit breaker."""
+        try:
+            return await self._breaker.call(func, *args)
+        except CircuitBreakerOpenError as err:
+            raise StopfinderConnectionError(str(err)) from err
 
-    def _get_headers(self, include_token: bool = False) -> dict[str, str]:
+    def _get_headers(self, include_token: bool = False) -> Mapping[str, str]:
         """Get headers for API requests."""
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Origin": "file://",
-            "X-Requested-With": "com.transfinder.stopfinder",
-            "X-StopfinderApp-Version": APP_VERSION,
-        }
         if include_token and self._token:
-            headers["Token"] = self._token
+            return {**_STATIC_HEADERS, "Token": self._token}
+        return _STATIC_HEADERS
+
+    def _schedule_headers(self) -> dict[str, str]:
+        """Build headers for a schedule request, with cache validators."""
+        headers = self._auth_headers
+        if headers is None:
+            headers = dict(self._get_headers(include_token=True))
+            if self._client_id:
+                headers["X-Client-Keys"] = self._client_id
+            self._auth_headers = headers
+        if self._cached_schedules is not None and (
+            self._last_etag or self._last_modified
+        ):
+            # Copy so the validators never leak into the cached header set
+            headers = dict(headers)
+            if self._last_etag:
+                headers["If-None-Match"] = self._last_etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
         return headers
 
     async def _get_stopfinder_base_url(self) -> str:
         """Get the Stopfinder API base URL from the Transfinder server."""
+        cached = _BASE_URL_CACHE.get(self._base_url)
+        if cached and time.monotonic() < cached[1]:
+            _LOGGER.debug("Using cached API base URL: %s", cached[0])
+            return cached[0]
+
         url = f"{self._base_url}/$xcom/getStopfinder.asp?/email=test"
         _LOGGER.debug("Discovering API base URL from %s", url)
-        try:
-            async with self._session.get(
-                url, headers=self._get_headers(), ssl=False
-            ) as response:
-                if response.status != 200:
+
+        async def _request() -> str:
+            try:
+                async with self._session.get(
+                    url,
+                    headers=self._get_headers(),
+                    ssl=False,
+                    timeout=_REQUEST_TIMEOUT,
+                ) as response:
+                    if response.status != 200:
+                        raise StopfinderConnectionError(
+                            f"Failed to get Stopfinder URL: {response.status}"
+                        )
+                    data = await response.text()
+                    data = data.strip()
+                    if data.startswith("http"):
+                        _LOGGER.debug("Discovered API base URL: %s", data)
+                        return data
                     raise StopfinderConnectionError(
-                        f"Failed to get Stopfinder URL: {response.status}"
+                        "Invalid response from Stopfinder discovery"
                     )
-                data = await response.text()
-                data = data.strip()
-                if data.startswith("http"):
-                    _LOGGER.debug("Discovered API base URL: %s", data)
-                    return data
-                raise StopfinderConnectionError("Invalid response from Stopfinder discovery")
-        except aiohttp.ClientError as err:
-            raise StopfinderConnectionError(f"Connection error: {err}") from err
+            except aiohttp.ClientError as err:
+                raise StopfinderConnectionError(f"Connection error: {err}") from err
+
+        discovered = await self._guarded(_request)
+        _BASE_URL_CACHE[self._base_url] = (
+            discovered,
+            time.monotonic() + _BASE_URL_CACHE_TTL,
+        )
+        return discovered
 
     async def _authenticate(self) -> None:
         """Authenticate with the Stopfinder API."""
@@ -97,25 +295,66 @@ class StopfinderApiClient:
 
         url = f"{self._api_base_url}/tokens"
         _LOGGER.debug("Authenticating user %s at %s", self._username, url)
-        try:
-            async with self._session.post(
-                url, json=auth_data, headers=self._get_headers(), ssl=False
-            ) as response:
-                if response.status in (400, 401):
-                    _LOGGER.debug("Authentication rejected: status %s", response.status)
-                    raise StopfinderAuthError("Invalid credentials")
-                if response.status not in (200, 201):
-                    _LOGGER.debug("Authentication failed: status %s", response.status)
-                    raise StopfinderAuthError(
-                        f"Authentication failed: {response.status}"
+
+        async def _request() -> None:
+            try:
+                async with self._session.post(
+                    url,
+                    json=auth_data,
+                    headers=self._get_headers(),
+                    ssl=False,
+                    timeout=_REQUEST_TIMEOUT,
+                ) as response:
+                    if response.status in (400, 401):
+                        _LOGGER.debug(
+                            "Authentication rejected: status %s", response.status
+                        )
+                        raise StopfinderAuthError("Invalid credentials")
+                    if response.status not in (200, 201):
+                        _LOGGER.debug(
+                            "Authentication failed: status %s", response.status
+                        )
+                        raise StopfinderAuthError(
+                            f"Authentication failed: {response.status}"
+                        )
+                    data = await response.json(loads=_json_loads)
+                    self._token = data.get("token")
+                    if not self._token:
+                        raise StopfinderAuthError("No token in response")
+                    self._token_expires_at = self._compute_token_expiry(data)
+                    _LOGGER.debug(
+                        "Authentication successful, token valid until %s",
+                        self._token_expires_at,
                     )
-                data = await response.json()
-                self._token = data.get("token")
-                if not self._token:
-                    raise StopfinderAuthError("No token in response")
-                _LOGGER.debug("Authentication successful")
-        except aiohttp.ClientError as err:
-            raise StopfinderConnectionError(f"Connection error: {err}") from err
+            except aiohttp.ClientError as err:
+                raise StopfinderConnectionError(f"Connection error: {err}") from err
+
+        await self._guarded(_request)
+
+    def _compute_token_expiry(self, data: dict[str, Any]) -> datetime:
+        """Determine when the freshly issued token expires."""
+        expires_in = data.get("expiresIn")
+        if expires_in is not None:
+            try:
+                return (
+                    datetime.utcnow()
+                    + timedelta(seconds=float(expires_in))
+                    - TOKEN_EXPIRY_MARGIN
+                )
+            except (TypeError, ValueError):
+                pass
+        jwt_expiry = _decode_jwt_expiry(self._token)
+        if jwt_expiry is not None:
+            return jwt_expiry - TOKEN_EXPIRY_MARGIN
+        return datetime.utcnow() + DEFAULT_TOKEN_TTL - TOKEN_EXPIRY_MARGIN
+
+    def _token_is_valid(self) -> bool:
+        """Return True if the cached token is still usable."""
+        return (
+            self._token is not None
+            and self._token_expires_at is not None
+            and datetime.utcnow() < self._token_expires_at
+        )
 
     async def _get_client_id(self) -> str:
         """Get the client ID from API versions endpoint."""
@@ -126,13 +365,16 @@ class StopfinderApiClient:
         _LOGGER.debug("Fetching client ID from %s", url)
         try:
             async with self._session.get(
-                url, headers=self._get_headers(include_token=True), ssl=False
+                url,
+                headers=self._get_headers(include_token=True),
+                ssl=False,
+                timeout=_REQUEST_TIMEOUT,
             ) as response:
                 if response.status != 200:
                     raise StopfinderApiError(
                         f"Failed to get API versions: {response.status}"
                     )
-                data = await response.json()
+                data = await response.json(loads=_json_loads)
                 if isinstance(data, list) and len(data) > 0:
                     self._client_id = data[0].get("clientId")
                     _LOGGER.debug("Got client ID: %s", self._client_id)
@@ -144,177 +386,224 @@ class StopfinderApiClient:
     async def authenticate(self) -> bool:
         """Authenticate and get client ID."""
         await self._authenticate()
-        await self._get_client_id()
+        if self._client_id is None:
+            await self._get_client_id()
+        # Precompute the full authenticated header set; it only changes
+        # when we re-authenticate.
+        headers = {**_STATIC_HEADERS, "Token": self._token}
+        if self._client_id:
+            headers["X-Client-Keys"] = self._client_id
+        self._auth_headers = headers
         return True
 
     async def get_schedules(
         self, date_start: datetime | None = None, date_end: datetime | None = None
-    ) -> list[dict[str, Any]]:
+    ) -> list[Student]:
         """Get student schedules."""
-        if not self._token:
-            _LOGGER.debug("No token, authenticating first")
+        if not self._token_is_valid():
+            _LOGGER.debug("No valid token, authenticating first")
             await self.authenticate()
 
         if not self._api_base_url:
             raise StopfinderApiError("API base URL not set")
 
-        if date_start is None:
-            date_start = datetime.now()
-        if date_end is None:
-            date_end = date_start + timedelta(days=7)
-
-        start_str = date_start.strftime("%Y-%m-%d")
-        end_str = date_end.strftime("%Y-%m-%d")
-
-        url = f"{self._api_base_url}/students?dateStart={start_str}&dateEnd={end_str}"
-        headers = self._get_headers(include_token=True)
-        if self._client_id:
-            headers["X-Client-Keys"] = self._client_id
-
-        _LOGGER.debug("Fetching schedules from %s to %s", start_str, end_str)
+        if date_start is None and date_end is None:
+            today = date.today()
+            today_str = today.isoformat()
+            if self._cached_url and self._cached_url[0] == today_str:
+                url = self._cached_url[1]
+            else:
+                end_str = (today + timedelta(days=7)).isoformat()
+                url = (
+                    f"{self._api_base_url}/students"
+                    f"?dateStart={today_str}&dateEnd={end_str}"
+                )
+                self._cached_url = (today_str, url)
+        else:
+            if date_start is None:
+                date_start = datetime.now()
+            if date_end is None:
+                date_end = date_start + timedelta(days=7)
+            start_str = date_start.strftime("%Y-%m-%d")
+            end_str = date_end.strftime("%Y-%m-%d")
+            url = (
+                f"{self._api_base_url}/students"
+                f"?dateStart={start_str}&dateEnd={end_str}"
+            )
+        headers = self._schedule_headers()
+
+        _LOGGER.debug("Fetching schedules: %s", url)
+        result = await self._guarded(self._fetch_schedules, url, headers)
+        if result is None:
+            # Stale token; re-authenticate and retry once
+            _LOGGER.debug("Schedule request rejected as unauthorized, re-authenticating")
+            self._token = None
+            self._token_expires_at = None
+            self._auth_headers = None
+            await self.authenticate()
+            headers = self._schedule_headers()
+            result = await self._guarded(self._fetch_schedules, url, headers)
+            if result is None:
+                _LOGGER.error("Schedule retry also rejected as unauthorized")
+                raise StopfinderAuthError(
+                    "Schedule request rejected even after re-authentication"
+                )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Fetched schedules: %d students, %d total trips",
+                len(result),
+                sum(len(s.trips) for s in result),
+            )
+        return result
+
+    async def _fetch_schedules(
+        self, url: str, headers: dict[str, str]
+    ) -> list[Student] | None:
+        """Perform a single schedule request.
+
+        Returns the parsed schedules, or None when the token was rejected
+        (401/403) so the caller can re-authenticate.
+        """
         try:
-            async with self._session.get(url, headers=headers, ssl=False) as response:
+            async with self._session.get(
+                url, headers=headers, ssl=False, timeout=_REQUEST_TIMEOUT
+            ) as response:
                 if response.status == 200:
                     result = await self._parse_schedule_response(response)
-                    _LOGGER.debug(
-                        "Fetched schedules: %d students, %d total trips",
-                        len(result),
-                        sum(len(s.get("trips", [])) for s in result),
-                    )
+                    self._last_etag = response.headers.get("ETag")
+                    self._last_modified = response.headers.get("Last-Modified")
+                    if self._last_etag or self._last_modified:
+                        self._cached_schedules = result
+                    else:
+                        self._cached_schedules = None
                     return result
-                # Any non-200 might be a stale token; re-authenticate and retry
-                _LOGGER.debug(
-                    "Schedule request failed with status %s, re-authenticating",
-                    response.status,
-                )
-                self._token = None
-                await self.authenticate()
-                headers = self._get_headers(include_token=True)
-                if self._client_id:
-                    headers["X-Client-Keys"] = self._client_id
-                async with self._session.get(
-                    url, headers=headers, ssl=False
-                ) as retry_response:
-                    if retry_response.status != 200:
-                        _LOGGER.error(
-                            "Schedule retry also failed with status %s",
-                            retry_response.status,
-                        )
-                        raise StopfinderApiError(
-                            f"Failed to get schedules: {retry_response.status}"
-                        )
-                    result = await self._parse_schedule_response(retry_response)
-                    _LOGGER.debug(
-                        "Fetched schedules after retry: %d students, %d total trips",
-                        len(result),
-                        sum(len(s.get("trips", [])) for s in result),
+                if response.status == 304 and self._cached_schedules is not None:
+                    _LOGGER.debug("Schedules not modified, reusing cached copy")
+                    return self._cached_schedules
+                if response.status in (401, 403):
+                    return None
+                if response.status >= 500:
+                    # Retryable 5xx were already retried by RetryClient;
+                    # never re-authenticate for a server-side failure.
+                    raise StopfinderConnectionError(
+                        f"Server error fetching schedules: {response.status}"
                     )
-                    return result
+                raise StopfinderApiError(
+                    f"Failed to get schedules: {response.status}"
+                )
         except aiohttp.ClientError as err:
             raise StopfinderConnectionError(f"Connection error: {err}") from err
 
     @staticmethod
-    def _fix_date(time_str: str | None, schedule_date: str) -> str | None:
-        """Replace the date portion of a time string with the correct schedule date.
-
-        The API returns times with an incorrect/static date; the real date
-        comes from the parent schedule object.
+    def _fix_and_adjust(
+        time_str: str | None, schedule_date: str, delta: timedelta | None
+    ) -> str | None:
+        """Rewrite a trip time onto the schedule date and apply its offset.
+
+        The API returns times with an incorrect/static date (the real date
+        comes from the parent schedule day object) plus a per-trip
+        adjustMinutes offset. Doing both in one pass needs at most a single
+        datetime parse per field.
         """
-        if not time_str or len(schedule_date) < 10:
-            return time_str
+        if not time_str:
+            return None
         # Replace the date part (first 10 chars) with the schedule date
-        if len(time_str) >= 10 and "T" in time_str:
-            return schedule_date + time_str[10:]
-        return time_str
-
-    @staticmethod
-    def _adjust_time(time_str: str | None, adjust_minutes: int) -> str | None:
-        """Apply adjustMinutes offset to a time string."""
-        if not time_str or adjust_minutes == 0:
+        if len(schedule_date) >= 10 and len(time_str) >= 10 and "T" in time_str:
+            time_str = schedule_date + time_str[10:]
+        if not delta:
             return time_str
         try:
-            dt = datetime.fromisoformat(time_str)
-            dt += timedelta(minutes=adjust_minutes)
-            return dt.isoformat()
-        except (ValueError, AttributeError):
+            return (datetime.fromisoformat(time_str) + delta).isoformat()
+        except ValueError:
             return time_str
 
     async def _parse_schedule_response(
         self, response: aiohttp.ClientResponse
-    ) -> list[dict[str, Any]]:
-        """Parse the schedule response."""
-        data = await response.json()
-        students_by_id: dict[str, dict[str, Any]] = {}
-
-        if isinstance(data, list):
-            for schedule_data in data:
-                student_schedules = schedule_data.get("studentSchedules", [])
-                for student in student_schedules:
-                    rider_id = student.get("riderId", "")
-                    if rider_id not in students_by_id:
-                        students_by_id[rider_id] = {
-                            "first_name": student.get("firstName", ""),
-                            "last_name": student.get("lastName", ""),
-                            "grade": student.get("grade", ""),
-                            "school": student.get("school", ""),
-                            "rider_id": rider_id,
-                            "trips": [],
-                        }
-                    for trip in student.get("trips", []):
-                        adjust = trip.get("adjustMinutes", 0)
-                        # Fix dates: API returns wrong date in times,
-                        # real date comes from the schedule day object
-                        raw_pickup = self._fix_date(
-                            trip.get("pickUpTime"), schedule_date
-                        )
-                        raw_dropoff = self._fix_date(
-                            trip.get("dropOffTime"), schedule_date
-                        )
-                        raw_start = self._fix_date(
-                            trip.get("startTime"), schedule_date
-                        )
-                        raw_finish = self._fix_date(
-                            trip.get("finishTime"), schedule_date
-                        )
-                        adj_pickup = self._adjust_time(raw_pickup, adjust)
-                        adj_dropoff = self._adjust_time(raw_dropoff, adjust)
-                        _LOGGER.debug(
-                            "%s %s: %s toSchool=%s adjust=%d | "
-                            "pickup: %s -> %s | dropoff: %s -> %s",
-                            schedule_date,
-                            student.get("firstName", ""),
-                            trip.get("name", ""),
-                            trip.get("toSchool"),
-                            adjust,
-                            raw_pickup,
-                            adj_pickup,
-                            raw_dropoff,
-                            adj_dropoff,
-                        )
-                        students_by_id[rider_id]["trips"].append(
-                            {
-                                "name": trip.get("name", ""),
-                                "bus_number": trip.get("busNumber", ""),
-                                "pickup_time": self._adjust_time(
-                                    trip.get("pickUpTime"), adjust
-                                ),
-                                "pickup_stop_name": trip.get("pickUpStopName", ""),
-                                "dropoff_time": self._adjust_time(
-                                    trip.get("dropOffTime"), adjust
-                                ),
-                                "dropoff_stop_name": trip.get("dropOffStopName", ""),
-                                "to_school": trip.get("toSchool", False),
-                                "vehicle_id": trip.get("vehicleId", ""),
-                                "start_time": self._adjust_time(
-                                    raw_start, adjust
-                                ),
-                                "finish_time": self._adjust_time(
-                                    raw_finish, adjust
-                                ),
-                            }
-                        )
+    ) -> list[Student]:
+        """Parse the schedule response.
+
+        Schedule day objects are parsed incrementally from the response
+        stream, so decode work overlaps the tail of the HTTP receive and
+        peak memory stays bounded by one day object instead of the full
+        multi-day payload.
+        """
+        students_by_id: dict[str, Student] = {}
+        # Evaluated once so the per-trip debug call below costs nothing
+        # when debug logging is off.
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
+        async for schedule_data in ijson.items(response.content, "item"):
+            self._merge_schedule_day(schedule_data, students_by_id, debug)
         return list(students_by_id.values())
 
+    def _merge_schedule_day(
+        self,
+        schedule_data: dict[str, Any],
+        students_by_id: dict[str, Student],
+        debug: bool,
+    ) -> None:
+        """Merge one schedule day object into the per-student records."""
+        # Local aliases keep attribute lookups out of the per-trip loop.
+        fix_and_adjust = self._fix_and_adjust
+        student_schedules = schedule_data.get("studentSchedules", [])
+        schedule_date = schedule_data.get("date", "")
+        for student in student_schedules:
+            rider_id = student.get("riderId", "")
+            record = students_by_id.get(rider_id)
+            if record is None:
+                record = students_by_id[rider_id] = Student(
+                    rider_id=rider_id,
+                    first_name=student.get("firstName", ""),
+                    last_name=student.get("lastName", ""),
+                    grade=student.get("grade", ""),
+                    school=student.get("school", ""),
+                )
+            trips = record.trips
+            for trip in student.get("trips", []):
+                trip_get = trip.get
+                adjust = trip_get("adjustMinutes", 0)
+                delta = timedelta(minutes=adjust) if adjust else None
+                # Fix dates: API returns wrong date in times,
+                # real date comes from the schedule day object
+                pickup = fix_and_adjust(
+                    trip_get("pickUpTime"), schedule_date, delta
+                )
+                dropoff = fix_and_adjust(
+                    trip_get("dropOffTime"), schedule_date, delta
+                )
+                start = fix_and_adjust(
+                    trip_get("startTime"), schedule_date, delta
+                )
+                finish = fix_and_adjust(
+                    trip_get("finishTime"), schedule_date, delta
+                )
+                if debug:
+                    _LOGGER.debug(
+                        "%s %s: %s toSchool=%s adjust=%d | "
+                        "pickup=%s | dropoff=%s",
+                        schedule_date,
+                        student.get("firstName", ""),
+                        trip_get("name", ""),
+                        trip_get("toSchool"),
+                        adjust,
+                        pickup,
+                        dropoff,
+                    )
+                trips.append(
+                    Trip(
+                        name=trip_get("name", ""),
+                        bus_number=trip_get("busNumber", ""),
+                        pickup_time=pickup,
+                        pickup_stop_name=trip_get("pickUpStopName", ""),
+                        dropoff_time=dropoff,
+                        dropoff_stop_name=trip_get("dropOffStopName", ""),
+                        to_school=trip_get("toSchool", False),
+                        vehicle_id=trip_get("vehicleId", ""),
+                        start_time=start,
+                        finish_time=finish,
+                    )
+                )
+
     async def test_connection(self) -> bool:
         """Test the connection to the API."""
         try:
@@ -3,6 +3,7 @@
 DOMAIN = "stopfinder"
 
 CONF_BASE_URL = "base_url"
+CONF_CLIENT_ID = "client_id"
 
 DEFAULT_SCAN_INTERVAL = 3600  # 60 minutes
 
@@ -2,21 +2,109 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
+from operator import itemgetter
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .api import StopfinderApiClient, StopfinderApiError
-from .const import CONF_BASE_URL, DEFAULT_SCAN_INTERVAL, DOMAIN
+try:
+    from ciso8601 import parse_datetime as _fast_parse
+except ImportError:  # pragma: no cover - optional speedup
+    _fast_parse = datetime.fromisoformat
+
+from .api import StopfinderApiClient, StopfinderApiError, Student, Trip
+from .const import CONF_BASE_URL, CONF_CLIENT_ID, DEFAULT_SCAN_INTERVAL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# A direction's pre-sorted trips: parallel lists of epoch timestamps and
+# the trips they belong to, ready for bisecting against "now".
+TripIndex = tuple[list[float], list[Trip]]
+
+
+def _trip_dt_slow(time_str: str) -> datetime | None:
+    """Fallback parse for time strings the fast parser rejects."""
+    try:
+        dt = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return dt
+
+
+@lru_cache(maxsize=1024)
+def _trip_dt(time_str: str) -> datetime | None:
+    """Parse a trip time string to a timezone-aware datetime, memoized.
+
+    Valid ISO strings (the overwhelmingly common case) take the single
+    try/except fast path; malformed input drops to _trip_dt_slow.
+    """
+    try:
+        dt = _fast_parse(time_str)
+    except (ValueError, AttributeError):
+        return _trip_dt_slow(time_str)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return dt
+
+
+def _sorted_index(entries: list[tuple[float, Trip]]) -> TripIndex:
+    """Sort (timestamp, trip) pairs and split into parallel lists."""
+    entries.sort(key=itemgetter(0))
+    return [e[0] for e in entries], [e[1] for e in entries]
+
+
+def _build_trip_index(
+    students: list[Student],
+) -> dict[str, dict[bool | None, TripIndex]]:
+    """Pre-sort each student's trips by time, once per update.
+
+    Keyed by the to_school filter the sensors use (True/False/None), so
+    finding the next future trip is a single bisect instead of a linear
+    scan with datetime parsing on every sensor read. The relevant time is
+    the pickup for to-school trips and the drop-off (falling back to
+    pickup) for from-school trips, matching the sensor semantics.
+    """
+    index: dict[str, dict[bool | None, TripIndex]] = {}
+    for student in students:
+        to_school: list[tuple[float, Trip]] = []
+        from_school: list[tuple[float, Trip]] = []
+        any_dir: list[tuple[float, Trip]] = []
+        for trip in student.trips:
+            # Annotate the trip with parsed datetimes while we are here;
+            # sensors then never parse a time string themselves
+            trip.pickup_dt = _trip_dt(trip.pickup_time) if trip.pickup_time else None
+            trip.dropoff_dt = (
+                _trip_dt(trip.dropoff_time) if trip.dropoff_time else None
+            )
+            trip.start_dt = _trip_dt(trip.start_time) if trip.start_time else None
+            if trip.to_school:
+                relevant = trip.pickup_dt
+                if relevant is not None:
+                    to_school.append((relevant.timestamp(), trip))
+            else:
+                relevant = trip.dropoff_dt or trip.pickup_dt
+                if relevant is not None:
+                    from_school.append((relevant.timestamp(), trip))
+            if relevant is not None:
+                any_dir.append((relevant.timestamp(), trip))
+        index[student.rider_id] = {
+            True: _sorted_index(to_school),
+            False: _sorted_index(from_school),
+            None: _sorted_index(any_dir),
+        }
+    return index
+
 
 class StopfinderCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Stopfinder data update coordinator."""
@@ -30,31 +118,73 @@ class StopfinderCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # Mid-day polls usually return byte-identical schedules; skip
+            # listener dispatch and state writes when nothing changed.
+            always_update=False,
         )
         self.config_entry = entry
-        session = async_get_clientsession(hass)
+        # The client owns a dedicated session so connections stay warm
+        # across polls; it is closed in async_shutdown.
         self.client = StopfinderApiClient(
             base_url=entry.data[CONF_BASE_URL],
             username=entry.data[CONF_USERNAME],
             password=entry.data[CONF_PASSWORD],
-            session=session,
+            client_id=entry.data.get(CONF_CLIENT_ID),
         )
 
+    async def async_shutdown(self) -> None:
+        """Shut down the coordinator and close the API client session."""
+        await super().async_shutdown()
+        await self.client.close()
+
+    def _async_persist_client_id(self) -> None:
+        """Store the discovered client ID so restarts skip its lookup."""
+        client_id = self.client.client_id
+        if client_id and client_id != self.config_entry.data.get(CONF_CLIENT_ID):
+            self.hass.config_entries.async_update_entry(
+                self.config_entry,
+                data={**self.config_entry.data, CONF_CLIENT_ID: client_id},
+            )
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API."""
         try:
-            schedules = await self.client.get_schedules()
+            # End-to-end deadline covering discovery, auth and retries
+            async with asyncio.timeout(60):
+                schedules = await self.client.get_schedules()
+            self._async_persist_client_id()
+            # Student/Trip dataclass equality gives a cheap deep compare
+            if self.data is not None and schedules == self.data["students"]:
+                _LOGGER.debug("Update successful: schedules unchanged")
+                return self.data
             _LOGGER.debug(
                 "Update successful: %d students",
                 len(schedules),
             )
-            return {"students": schedules}
-        except StopfinderApiError as err:
+            # Precompute the names and device keys the sensor platform
+            # needs, so entity (re)creation does no string formatting
+            entry_id = self.config_entry.entry_id
+            for student in schedules:
+                student.display_name = (
+                    f"{student.first_name} {student.last_name}".strip()
+                    or student.rider_id
+                )
+                student.device_key = f"{entry_id}_{student.rider_id}"
+            return {
+                "students": schedules,
+                # Indexes built once here so sensors avoid linear scans
+                "students_by_id": {s.rider_id: s for s in schedules},
+                "trip_index": _build_trip_index(schedules),
+                # Reference "now" for this refresh cycle; sensors compare
+                # trip timestamps against it instead of re-reading the clock
+                "_now_ts": time.time(),
+            }
+        except (TimeoutError, StopfinderApiError) as err:
             if self.data:
                 _LOGGER.warning(
                     "Error fetching data (%s), keeping last known data with %d students",
                     err,
-                    len(self.data.get("students", [])),
+                    len(self.data["students"]),
                 )
                 return self.data
             _LOGGER.error("Error fetching data with no previous data to fall back on: %s", err)
@@ -0,0 +1,90 @@
+"""Reliability helpers for the Stopfinder integration."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from enum import Enum
+from typing import Any, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class CircuitBreakerOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitState(Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Minimal circuit breaker for calls to a single upstream.
+
+    After ``threshold`` consecutive failures the breaker opens and calls
+    fail fast with CircuitBreakerOpenError for ``recovery`` seconds.
+    After the cooldown, one probe call is allowed through (half-open);
+    its success closes the breaker again, its failure re-opens it.
+    """
+
+    def __init__(self, threshold: int = 5, recovery: float = 60.0) -> None:
+        """Initialize the breaker in the closed state."""
+        self._threshold = threshold
+        self._recovery = recovery
+        self._state = CircuitState.CLOSED
+        self._failure_count = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current breaker state."""
+        return self._state
+
+    async def call(
+        self, func: Callable[..., Awaitable[_T]], *args: Any, **kwargs: Any
+    ) -> _T:
+        """Run ``func`` through the breaker."""
+        if self._state is CircuitState.OPEN:
+            elapsed = time.monotonic() - self._opened_at
+            if elapsed < self._recovery:
+                raise CircuitBreakerOpenError(
+                    f"Circuit open, retrying in {self._recovery - elapsed:.0f}s"
+                )
+            _LOGGER.debug("Circuit half-open, allowing probe call")
+            self._state = CircuitState.HALF_OPEN
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            self._record_failure()
+            raise
+        self._record_success()
+        return result
+
+    def _record_success(self) -> None:
+        """Reset the breaker after a successful call."""
+        if self._state is not CircuitState.CLOSED:
+            _LOGGER.debug("Circuit closed after successful call")
+        self._state = CircuitState.CLOSED
+        self._failure_count = 0
+
+    def _record_failure(self) -> None:
+        """Count a failure and open the breaker when the threshold is hit."""
+        self._failure_count += 1
+        if (
+            self._state is CircuitState.HALF_OPEN
+            or self._failure_count >= self._threshold
+        ):
+            if self._state is not CircuitState.OPEN:
+                _LOGGER.warning(
+                    "Circuit opened after %d consecutive failures",
+                    self._failure_count,
+                )
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -11,17 +13,118 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util
 
+from .api import Student, Trip
 from .const import DOMAIN
 from .coordinator import StopfinderCoordinator
 
 
+@dataclass(frozen=True, slots=True)
+class _FieldSpec:
+    """Describes one sensor type of the per-student sensor family.
+
+    Either ``value_key`` names the Trip attribute providing the value
+    (with ``to_school`` selecting which trip) or ``student_key`` names a
+    Student attribute. ``attr_keys``/``student_attr_keys`` map extra
+    state attribute names to Trip/Student attributes.
+    """
+
+    description: SensorEntityDescription
+    to_school: bool | None = None
+    value_key: str | None = None
+    student_key: str | None = None
+    attr_keys: tuple[tuple[str, str], ...] = ()
+    student_attr_keys: tuple[tuple[str, str], ...] = ()
+
+
+# One spec per sensor type; descriptions are immutable and shared by
+# every student's sensors, built once at import time.
+_SPECS: Final[tuple[_FieldSpec, ...]] = (
+    _FieldSpec(
+        description=SensorEntityDescription(
+            key="next_pickup",
+            name="Next Pickup",
+            device_class=SensorDeviceClass.TIMESTAMP,
+            icon="mdi:bus-clock",
+        ),
+        to_school=True,
+        value_key="pickup_dt",
+        attr_keys=(
+            ("stop_name", "pickup_stop_name"),
+            ("bus_number", "bus_number"),
+            ("trip_name", "name"),
+        ),
+    ),
+    _FieldSpec(
+        description=SensorEntityDescription(
+            key="next_dropoff",
+            name="Next Drop-off",
+            device_class=SensorDeviceClass.TIMESTAMP,
+            icon="mdi:bus-stop",
+        ),
+        to_school=False,
+        value_key="dropoff_dt",
+        attr_keys=(
+            ("stop_name", "dropoff_stop_name"),
+            ("bus_number", "bus_number"),
+            ("trip_name", "name"),
+        ),
+    ),
+    _FieldSpec(
+        description=SensorEntityDescription(
+            key="bus_number",
+            name="Bus Number",
+            icon="mdi:bus",
+        ),
+        value_key="bus_number",
+    ),
+    _FieldSpec(
+        description=SensorEntityDescription(
+            key="school",
+            name="School",
+            icon="mdi:school",
+        ),
+        student_key="school",
+        student_attr_keys=(("grade", "grade"),),
+    ),
+    _FieldSpec(
+        description=SensorEntityDescription(
+            key="pickup_stop",
+            name="Pickup Stop",
+            icon="mdi:map-marker",
+        ),
+        to_school=True,
+        value_key="pickup_stop_name",
+    ),
+    _FieldSpec(
+        description=SensorEntityDescription(
+            key="dropoff_stop",
+            name="Drop-off Stop",
+            icon="mdi:map-marker-check",
+        ),
+        to_school=False,
+        value_key="dropoff_stop_name",
+    ),
+    _FieldSpec(
+        description=SensorEntityDescription(
+            key="route_start",
+            name="Route Start",
+            device_class=SensorDeviceClass.TIMESTAMP,
+            icon="mdi:bus-alert",
+        ),
+        value_key="start_dt",
+        attr_keys=(
+            ("trip_name", "name"),
+            ("bus_number", "bus_number"),
+        ),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -35,412 +138,126 @@ async def async_setup_entry(
     # Wait for first data update
     await coordinator.async_config_entry_first_refresh()
 
-    # Create sensors for each student
-    students = coordinator.data.get("students", []) if coordinator.data else []
-    for student in students:
-        rider_id = student.get("rider_id", "")
-        first_name = student.get("first_name", "")
-        last_name = student.get("last_name", "")
-        student_name = f"{first_name} {last_name}".strip() or rider_id
-
-        entities.extend(
-            [
-                StopfinderNextPickupSensor(
-                    coordinator, entry, rider_id, student_name, student
-                ),
-                StopfinderNextDropoffSensor(
-                    coordinator, entry, rider_id, student_name, student
-                ),
-                StopfinderBusNumberSensor(
-                    coordinator, entry, rider_id, student_name, student
-                ),
-                StopfinderSchoolSensor(
-                    coordinator, entry, rider_id, student_name, student
-                ),
-                StopfinderPickupStopSensor(
-                    coordinator, entry, rider_id, student_name, student
-                ),
-                StopfinderDropoffStopSensor(
-                    coordinator, entry, rider_id, student_name, student
-                ),
-                StopfinderRouteStartSensor(
-                    coordinator, entry, rider_id, student_name, student
-                ),
-            ]
-        )
-
-    async_add_entities(entities)
-
-
-class StopfinderBaseSensor(CoordinatorEntity[StopfinderCoordinator], SensorEntity):
-    """Base class for Stopfinder sensors."""
-
-    _attr_has_entity_name = True
-
-    def __init__(
-        self,
-        coordinator: StopfinderCoordinator,
-        entry: ConfigEntry,
-        rider_id: str,
-        student_name: str,
-        student_data: dict[str, Any],
-        description: SensorEntityDescription,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._rider_id = rider_id
-        self._student_name = student_name
-        self._student_data = student_data
-        self._attr_unique_id = f"{entry.entry_id}_{rider_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{entry.entry_id}_{rider_id}")},
-            name=student_name,
+    # Create sensors for each student; the coordinator always returns the
+    # full normalized shape once the first refresh has succeeded
+    for student in coordinator.data["students"]:
+        # The coordinator pre-computes display_name and device_key, so
+        # entity creation (and re-creation on reload) just reads them
+        device_info = DeviceInfo(
+            identifiers={(DOMAIN, student.device_key)},
+            name=student.display_name,
             manufacturer="Transfinder",
             model="Stopfinder",
             entry_type=DeviceEntryType.SERVICE,
         )
-
-    @staticmethod
-    def _parse_datetime(time_str: str | None) -> datetime | None:
-        """Parse a datetime string and ensure it is timezone-aware."""
-        if not time_str:
-            return None
-        try:
-            dt = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-            return dt
-        except (ValueError, AttributeError):
-            return None
-
-    def _get_student_data(self) -> dict[str, Any] | None:
-        """Get current student data from coordinator."""
-        if not self.coordinator.data:
-            return None
-        students = self.coordinator.data.get("students", [])
-        for student in students:
-            if student.get("rider_id") == self._rider_id:
-                return student
-        return None
-
-    def _get_next_trip(self, to_school: bool | None = None) -> dict[str, Any] | None:
-        """Get the next trip for this student."""
-        student = self._get_student_data()
-        if not student:
-            return None
-
-        now = dt_util.now()
-        trips = student.get("trips", [])
-
-        next_trip = None
-        next_time = None
-
-        for trip in trips:
-            # Filter by direction if specified
-            if to_school is not None and trip.get("to_school") != to_school:
-                continue
-
-            # Get the relevant time based on trip direction
-            if to_school or (to_school is None and trip.get("to_school")):
-                time_str = trip.get("pickup_time")
-            else:
-                time_str = trip.get("dropoff_time") or trip.get("pickup_time")
-
-            trip_time = self._parse_datetime(time_str)
-            if not trip_time:
-                continue
-
-            # Only consider future trips
-            if trip_time > now:
-                if next_time is None or trip_time < next_time:
-                    next_time = trip_time
-                    next_trip = trip
-
-        return next_trip
-
-
-class StopfinderNextPickupSensor(StopfinderBaseSensor):
-    """Sensor for next pickup time."""
-
-    def __init__(
-        self,
-        coordinator: StopfinderCoordinator,
-        entry: ConfigEntry,
-        rider_id: str,
-        student_name: str,
-        student_data: dict[str, Any],
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(
-            coordinator,
-            entry,
-            rider_id,
-            student_name,
-            student_data,
-            SensorEntityDescription(
-                key="next_pickup",
-                name="Next Pickup",
-                device_class=SensorDeviceClass.TIMESTAMP,
-                icon="mdi:bus-clock",
-            ),
+        entities.extend(
+            StopfinderFieldSensor(coordinator, student, device_info, spec)
+            for spec in _SPECS
         )
 
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the next pickup time."""
-        trip = self._get_next_trip(to_school=True)
-        if not trip:
-            return None
-        return self._parse_datetime(trip.get("pickup_time"))
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        trip = self._get_next_trip(to_school=True)
-        if not trip:
-            return {}
-        return {
-            "stop_name": trip.get("pickup_stop_name", ""),
-            "bus_number": trip.get("bus_number", ""),
-            "trip_name": trip.get("name", ""),
-        }
-
-
-class StopfinderNextDropoffSensor(StopfinderBaseSensor):
-    """Sensor for next drop-off time."""
-
-    def __init__(
-        self,
-        coordinator: StopfinderCoordinator,
-        entry: ConfigEntry,
-        rider_id: str,
-        student_name: str,
-        student_data: dict[str, Any],
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(
-            coordinator,
-            entry,
-            rider_id,
-            student_name,
-            student_data,
-            SensorEntityDescription(
-                key="next_dropoff",
-                name="Next Drop-off",
-                device_class=SensorDeviceClass.TIMESTAMP,
-                icon="mdi:bus-stop",
-            ),
-        )
+    async_add_entities(entities)
 
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the next drop-off time."""
-        trip = self._get_next_trip(to_school=False)
-        if not trip:
-            return None
-        return self._parse_datetime(trip.get("dropoff_time"))
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        trip = self._get_next_trip(to_school=False)
-        if not trip:
-            return {}
-        return {
-            "stop_name": trip.get("dropoff_stop_name", ""),
-            "bus_number": trip.get("bus_number", ""),
-            "trip_name": trip.get("name", ""),
-        }
+class StopfinderFieldSensor(
+    CoordinatorEntity[StopfinderCoordinator], SensorEntity
+):
+    """A per-student sensor, parameterised by a _FieldSpec."""
 
+    # The Entity base classes are not slotted, so instances keep a
+    # __dict__ for the _attr_* machinery, but slotting our own fields
+    # still moves the per-entity hot attributes out of it.
+    __slots__ = (
+        "_spec",
+        "_rider_id",
+        "_student_name",
+        "_student_data",
+        "_current_value",
+        "_current_attrs",
+    )
 
-class StopfinderBusNumberSensor(StopfinderBaseSensor):
-    """Sensor for bus number."""
+    _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: StopfinderCoordinator,
-        entry: ConfigEntry,
-        rider_id: str,
-        student_name: str,
-        student_data: dict[str, Any],
+        student: Student,
+        device_info: DeviceInfo,
+        spec: _FieldSpec,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(
-            coordinator,
-            entry,
-            rider_id,
-            student_name,
-            student_data,
-            SensorEntityDescription(
-                key="bus_number",
-                name="Bus Number",
-                icon="mdi:bus",
-            ),
-        )
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the bus number for the next trip."""
-        trip = self._get_next_trip()
+        super().__init__(coordinator)
+        self.entity_description = spec.description
+        self._spec = spec
+        self._rider_id = student.rider_id
+        self._student_name = student.display_name
+        self._student_data = student
+        self._attr_unique_id = f"{student.device_key}_{spec.description.key}"
+        self._attr_device_info = device_info
+        # HA reads native_value and extra_state_attributes on every state
+        # write; compute both once per update instead of per property read
+        self._current_value: datetime | str | None = None
+        self._current_attrs: dict[str, Any] = {}
+        self._compute_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute value and attributes before writing state."""
+        self._compute_state()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _compute_state(self) -> None:
+        """Derive the state and attributes described by the spec."""
+        spec = self._spec
+        if spec.student_key is not None:
+            student = self._get_student_data()
+            if not student:
+                self._current_value = None
+                self._current_attrs = {}
+                return
+            self._current_value = getattr(student, spec.student_key) or None
+            self._current_attrs = {
+                name: getattr(student, key)
+                for name, key in spec.student_attr_keys
+            }
+            return
+        trip = self._get_next_trip(spec.to_school)
         if not trip:
-            return None
-        return trip.get("bus_number") or None
-
-
-class StopfinderSchoolSensor(StopfinderBaseSensor):
-    """Sensor for school name."""
-
-    def __init__(
-        self,
-        coordinator: StopfinderCoordinator,
-        entry: ConfigEntry,
-        rider_id: str,
-        student_name: str,
-        student_data: dict[str, Any],
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(
-            coordinator,
-            entry,
-            rider_id,
-            student_name,
-            student_data,
-            SensorEntityDescription(
-                key="school",
-                name="School",
-                icon="mdi:school",
-            ),
-        )
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the school name."""
-        student = self._get_student_data()
-        if not student:
-            return None
-        return student.get("school") or None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        student = self._get_student_data()
-        if not student:
-            return {}
-        return {
-            "grade": student.get("grade", ""),
+            self._current_value = None
+            self._current_attrs = {}
+            return
+        # Timestamp specs point at the datetime fields the coordinator
+        # pre-parsed; the rest are plain strings
+        self._current_value = getattr(trip, spec.value_key) or None
+        self._current_attrs = {
+            name: getattr(trip, key) for name, key in spec.attr_keys
         }
 
+    def _get_student_data(self) -> Student | None:
+        """Get current student data from coordinator."""
+        return self.coordinator.data["students_by_id"].get(self._rider_id)
 
-class StopfinderPickupStopSensor(StopfinderBaseSensor):
-    """Sensor for next pickup stop name."""
-
-    def __init__(
-        self,
-        coordinator: StopfinderCoordinator,
-        entry: ConfigEntry,
-        rider_id: str,
-        student_name: str,
-        student_data: dict[str, Any],
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(
-            coordinator,
-            entry,
-            rider_id,
-            student_name,
-            student_data,
-            SensorEntityDescription(
-                key="pickup_stop",
-                name="Pickup Stop",
-                icon="mdi:map-marker",
-            ),
-        )
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the pickup stop name for the next trip."""
-        trip = self._get_next_trip(to_school=True)
-        if not trip:
+    def _get_next_trip(self, to_school: bool | None = None) -> Trip | None:
+        """Find the next future trip for this student."""
+        data = self.coordinator.data
+        student_index = data["trip_index"].get(self._rider_id)
+        if not student_index:
             return None
-        return trip.get("pickup_stop_name") or None
-
-
-class StopfinderDropoffStopSensor(StopfinderBaseSensor):
-    """Sensor for next drop-off stop name."""
-
-    def __init__(
-        self,
-        coordinator: StopfinderCoordinator,
-        entry: ConfigEntry,
-        rider_id: str,
-        student_name: str,
-        student_data: dict[str, Any],
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(
-            coordinator,
-            entry,
-            rider_id,
-            student_name,
-            student_data,
-            SensorEntityDescription(
-                key="dropoff_stop",
-                name="Drop-off Stop",
-                icon="mdi:map-marker-check",
-            ),
-        )
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the drop-off stop name for the next trip."""
-        trip = self._get_next_trip(to_school=False)
-        if not trip:
+        # Trips are pre-sorted by the coordinator; jump straight to the
+        # first one after now instead of scanning and parsing them all.
+        keys, trips = student_index[to_school]
+        pos = bisect_right(keys, data["_now_ts"])
+        if pos >= len(keys):
             return None
-        return trip.get("dropoff_stop_name") or None
-
-
-class StopfinderRouteStartSensor(StopfinderBaseSensor):
-    """Sensor for when the bus route starts."""
-
-    def __init__(
-        self,
-        coordinator: StopfinderCoordinator,
-        entry: ConfigEntry,
-        rider_id: str,
-        student_name: str,
-        student_data: dict[str, Any],
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(
-            coordinator,
-            entry,
-            rider_id,
-            student_name,
-            student_data,
-            SensorEntityDescription(
-                key="route_start",
-                name="Route Start",
-                device_class=SensorDeviceClass.TIMESTAMP,
-                icon="mdi:bus-alert",
-            ),
-        )
+        return trips[pos]
 
     @property
-    def native_value(self) -> datetime | None:
-        """Return the start time of the next bus route."""
-        trip = self._get_next_trip()
-        if not trip:
-            return None
-        return self._parse_datetime(trip.get("start_time"))
+    def native_value(self) -> datetime | str | None:
+        """Return the sensor value described by the spec."""
+        return self._current_value
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        trip = self._get_next_trip()
-        if not trip:
-            return {}
-        return {
-            "trip_name": trip.get("name", ""),
-            "bus_number": trip.get("bus_number", ""),
-        }
+        """Return extra state attributes described by the spec."""
+        return self._current_attrs